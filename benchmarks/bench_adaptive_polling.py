@@ -0,0 +1,145 @@
+"""Simulación: intervalo fijo frente a intervalo adaptativo por horas de subida.
+
+Genera calendarios de subida sintéticos (semanal, diario, laborables,
+aleatorio...) y simula semana a semana las comprobaciones RSS que haría el
+planificador, usando las funciones reales del bot (adaptive_poll_interval y
+merge_upload_times). Para cada tipo de canal muestra:
+
+  - peticiones RSS al día
+  - latencia de detección media y p90 (publicación → comprobación que lo ve)
+
+Al final comprueba que el modo adaptativo no gasta más peticiones que el fijo
+(con un 10 % de margen por los despertares antes de las horas probables) y
+que el canal semanal, que apenas sube, hace bastantes menos. Sale con código
+1 si no se cumple.
+
+Uso:
+    python benchmarks/bench_adaptive_polling.py
+    python benchmarks/bench_adaptive_polling.py --weeks 12 --warmup-weeks 4
+"""
+
+import argparse
+import random
+import sys
+from datetime import datetime, timezone
+
+from bench_common import load_bot_module, percentile
+
+FEED_ENTRIES = 15
+START = datetime(2026, 1, 5, tzinfo=timezone.utc).timestamp()  # Lunes 00:00 UTC
+WEEK = 7 * 86400
+
+
+def weekly(day, hour, spread_minutes):
+    def uploads(rng, weeks):
+        return [START + w * WEEK + day * 86400 + hour * 3600 + rng.gauss(0, spread_minutes * 60) for w in range(weeks)]
+    return uploads
+
+
+def daily(hour, spread_minutes, days=range(7)):
+    def uploads(rng, weeks):
+        return [START + w * WEEK + d * 86400 + hour * 3600 + rng.gauss(0, spread_minutes * 60)
+                for w in range(weeks) for d in days]
+    return uploads
+
+
+def poisson(per_day):
+    def uploads(rng, weeks):
+        times, t = [], START
+        while True:
+            t += rng.expovariate(per_day / 86400)
+            if t >= START + weeks * WEEK:
+                return times
+            times.append(t)
+    return uploads
+
+
+# (nombre, calendario, poll_interval_seconds configurado a mano)
+CHANNEL_TYPES = [
+    ("semanal (vie 18:00)", weekly(4, 18, 20), 900),
+    ("diario (07:00)", daily(7, 30), 900),
+    ("laborables (16:00)", daily(16, 60, days=range(5)), 1800),
+    ("2 al día (09h y 21h)", lambda rng, w: daily(9, 30)(rng, w) + daily(21, 30)(rng, w), 1800),
+    ("aleatorio (~1/día)", poisson(1), 1800),
+]
+
+
+def simulate(bot, uploads, base_interval, weeks, warmup_weeks, adaptive_cfg):
+    """Simula las comprobaciones de un canal. Returns: (peticiones/día, latencias en s)."""
+    uploads = sorted(uploads)
+    end = START + weeks * WEEK
+    measure_from = START + warmup_weeks * WEEK
+    channel_data = {}
+    t = START
+    detected = 0                        # Índice del primer vídeo aún no detectado
+    checks = 0
+    latencies = []
+    while t < end:
+        # El feed muestra los últimos FEED_ENTRIES vídeos publicados hasta ahora
+        published = [u for u in uploads[:detected + 50] if u <= t]
+        visible = published[-FEED_ENTRIES:]
+        if t >= measure_from:
+            checks += 1
+        while detected < len(uploads) and uploads[detected] <= t:
+            if uploads[detected] >= measure_from:
+                latencies.append(t - uploads[detected])
+            detected += 1
+        if visible:
+            channel_data["upload_times"] = bot.merge_upload_times(channel_data, visible, adaptive_cfg)
+
+        if adaptive_cfg.get("enabled"):
+            interval = bot.adaptive_poll_interval(base_interval, channel_data.get("upload_times", []), t, adaptive_cfg)
+        else:
+            interval = base_interval
+        t += interval
+    days = (end - measure_from) / 86400
+    return (checks / days, latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--weeks", type=int, default=12, help="Semanas simuladas en total")
+    parser.add_argument("--warmup-weeks", type=int, default=4, help="Semanas iniciales que no se miden (aprendizaje)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    bot = load_bot_module()
+    adaptive_cfg = dict(bot.CONFIG["scheduler"]["adaptive"], enabled=True)
+    fixed_cfg = dict(adaptive_cfg, enabled=False)
+
+    print(f"{args.weeks} semanas simuladas ({args.warmup_weeks} de aprendizaje); "
+          f"límites adaptativos {adaptive_cfg['min_interval_seconds']}-{adaptive_cfg['max_interval_seconds']}s\n")
+    print(f"{'canal':<24}{'modo':<11}{'pet/día':>9}{'media min':>11}{'p90 min':>10}")
+    totals = {"fijo": [0.0, []], "adaptativo": [0.0, []]}
+    per_channel = {}
+    for name, schedule, base_interval in CHANNEL_TYPES:
+        uploads = schedule(random.Random(args.seed), args.weeks)
+        for mode, cfg in (("fijo", fixed_cfg), ("adaptativo", adaptive_cfg)):
+            per_day, latencies = simulate(bot, uploads, base_interval, args.weeks, args.warmup_weeks, cfg)
+            totals[mode][0] += per_day
+            per_channel[name, mode] = per_day
+            totals[mode][1].extend(latencies)
+            mean = sum(latencies) / len(latencies) / 60 if latencies else 0.0
+            print(f"{name:<24}{mode:<11}{per_day:>9.1f}{mean:>11.1f}{percentile(latencies, 90) / 60:>10.1f}")
+    print()
+    for mode, (per_day, latencies) in totals.items():
+        mean = sum(latencies) / len(latencies) / 60 if latencies else 0.0
+        print(f"{'TOTAL':<24}{mode:<11}{per_day:>9.1f}{mean:>11.1f}{percentile(latencies, 90) / 60:>10.1f}")
+    if not check_budget(per_channel):
+        sys.exit(1)
+
+
+def check_budget(per_channel):
+    """Comprueba el presupuesto de peticiones del modo adaptativo. Returns: True si todo bien."""
+    over = [name for name, _, _ in CHANNEL_TYPES
+            if per_channel[name, "adaptativo"] > 1.1 * per_channel[name, "fijo"]]
+    weekly_name = CHANNEL_TYPES[0][0]
+    sparse_ok = per_channel[weekly_name, "adaptativo"] < 0.6 * per_channel[weekly_name, "fijo"]
+    print(f"\nPresupuesto: {'OK' if not over and sparse_ok else 'FALLO'}"
+          + (f" (más peticiones que el fijo: {', '.join(over)})" if over else "")
+          + ("" if sparse_ok else f" ({weekly_name}: no ahorra peticiones)"))
+    return not over and sparse_ok
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Utilidades compartidas por los benchmarks.
+
+El bot es un único script ("V7 YOUTUBE .py"); aquí se carga como módulo
+para poder medir sus funciones reales sin ejecutar run_forever().
+"""
+
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOT_SCRIPT = os.path.join(REPO_DIR, "V7 YOUTUBE .py")
+
+
+def load_bot_module():
+    """Importa el script del bot como módulo `youtube_bot`."""
+    if "youtube_bot" in sys.modules:
+        return sys.modules["youtube_bot"]
+    spec = importlib.util.spec_from_file_location("youtube_bot", BOT_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["youtube_bot"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_call(func, *args, repeat=20):
+    """Ejecuta `func(*args)` `repeat` veces y devuelve la mediana en milisegundos."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def percentile(values, pct):
+    """Percentil `pct` (0-100) de una lista de valores (interpolación lineal)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+# Fragmentos con el estilo de los resúmenes que genera el modelo
+_CONCEPTS = ["Liquidez", "Curva de tipos", "VIX", "Beneficios", "Rotación sectorial",
+             "Dólar", "Crédito high yield", "Petróleo", "Opciones 0DTE", "Bonos a 10 años"]
+_PHRASES = ["el autor señala que la tendencia se mantiene mientras no pierda soporte",
+            "la Fed podría recortar antes de lo que descuenta el mercado",
+            "los márgenes empresariales se comprimen por costes laborales",
+            "la volatilidad implícita cotiza muy por debajo de la realizada",
+            "el posicionamiento de los fondos está en máximos de dos años"]
+
+
+def sample_model_output(target_bytes, seed=0):
+    """Genera un resumen HTML realista (formato del prompt) de ~`target_bytes` bytes.
+
+    Incluye las imperfecciones habituales del modelo: etiquetas <pre>/<code>,
+    <p>, etiquetas sin cerrar, mayúsculas y enlaces con atributos extra.
+    """
+    rng = random.Random(seed)
+    separator = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+    sections = [
+        ("🎯", "IDEA CENTRAL", ""),
+        ("💡", "GOLD NUGGETS", "  ▪️ "),
+        ("📊", "DATOS CLAVE", "  • "),
+        ("📈", "IMPLICACIONES", "  🔸 "),
+        ("⚠️", "RIESGOS Y ADVERTENCIAS", "  ❗ "),
+    ]
+    out = []
+    while len("".join(out).encode("utf-8")) < target_bytes:
+        for emoji, title, bullet in sections:
+            out.append(f"{separator}\n\n{emoji} <b>{title}</b>\n\n")
+            for _ in range(rng.randint(3, 7)):
+                concept = rng.choice(_CONCEPTS)
+                phrase = rng.choice(_PHRASES)
+                value = f"{rng.uniform(0.1, 99):.1f}%"
+                variant = rng.random()
+                if variant < 0.05:
+                    out.append(f"{bullet}<pre><code>{concept}: {value}</code></pre>\n")
+                elif variant < 0.10:
+                    out.append(f"{bullet}<p><B>{concept}:</B> {phrase}</p>\n")
+                elif variant < 0.15:
+                    out.append(f"{bullet}<b>{concept}:</b> <i>{phrase} ({value})\n")
+                elif variant < 0.20:
+                    out.append(f'{bullet}<a href="https://example.com/{rng.randint(1, 999)}" target="_blank">{concept}</a> — {phrase}\n')
+                else:
+                    out.append(f"{bullet}<b>{concept}:</b> {phrase} — <b>{value}</b>\n")
+            out.append("\n")
+        out.append(f"🔑 <b>CONCLUSIÓN</b>\n\n<i>{rng.choice(_PHRASES)}.</i>\n\n")
+    return "".join(out)
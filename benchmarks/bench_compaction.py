@@ -0,0 +1,121 @@
+"""Benchmark: compactación de transcripciones (compact_transcript).
+
+Genera subtítulos automáticos sintéticos de un canal de finanzas, con los
+defectos habituales (cada fragmento repite el final del anterior, marcas
+[Música], muletillas, tartamudeos y sin puntuación) y mide con las funciones
+reales del bot los tokens antes y después de compactar y el tiempo que tarda.
+
+Antes de medir comprueba que se quitan las muletillas en minúsculas pero no
+los tickers y siglas en mayúsculas que se parecen a ellas (EM, EEM, MMM, HMM...),
+que los fragmentos que solo dejan puntuación ("[Música],") no rompen la
+reconstrucción de frases y que los números repetidos no se toman por tartamudeos.
+Si alguna comprobación falla, mide igualmente y sale con código 1.
+
+Uso:
+    python benchmarks/bench_compaction.py
+    python benchmarks/bench_compaction.py --minutes 60 --repeat 20
+"""
+
+import argparse
+import random
+import sys
+
+from bench_common import load_bot_module, time_call
+
+COMPACTION_CFG = {"enabled": True, "strip_fillers": True, "pause_seconds": 0.8, "max_sentence_words": 40}
+TICKERS = ("EM", "EEM", "MMM", "HMM", "UUUU", "EH", "UM")
+_WORDS = ("el", "mercado", "sube", "los", "bonos", "caen", "la", "fed", "recorta", "tipos",
+          "dólar", "petróleo", "beneficios", "volatilidad", "soporte", "resistencia")
+_FILLERS = ("eh", "mmm", "uh", "um", "ehm", "hmm")
+
+
+def check_tickers(bot):
+    """Comprueba que los tickers sobreviven y las muletillas no. Returns: True si todo bien."""
+    cases = [
+        ("El ETF EEM y los EM subieron mientras MMM cayó un 3% y el HMM de UUUU.",
+         ("EEM", "EM", "MMM", "HMM", "UUUU")),
+        ("eh el mmm dólar um sube, Eh, y uh los bonos caen", ()),
+    ]
+    ok = True
+    for text, must_keep in cases:
+        compacted = bot.compact_transcript([[text, 0.0, 3.0]], COMPACTION_CFG)
+        words = set(compacted.replace(",", " ").replace(".", " ").split())
+        missing = [t for t in must_keep if t not in words]
+        left = [f for f in _FILLERS + ("Eh",) if f in words]
+        if missing or left:
+            print(f"  ✗ {text!r} → {compacted!r} (perdidos: {missing}, muletillas: {left})")
+            ok = False
+    print(f"Tickers y muletillas: {'OK' if ok else 'FALLO'}")
+    return ok
+
+
+def check_edge_cases(bot):
+    """Fragmentos que solo dejan puntuación y números repetidos. Returns: True si todo bien."""
+    cases = [
+        # (fragmentos, debe contener, no debe contener)
+        ([["el mercado sube hoy", 0.0, 2.0], ["[Música],", 4.0, 2.0], ["eh, :", 8.0, 2.0],
+          ["y los bonos caen", 12.0, 2.0]], ("El mercado sube hoy.", "Y los bonos caen."), (". .", ",.", ":.")),
+        ([["el índice subió un 10 10 por ciento y que que siguió", 0.0, 3.0]], ("un 10 10 por",), ("que que",)),
+    ]
+    ok = True
+    for snippets, must_have, must_not in cases:
+        try:
+            compacted = bot.compact_transcript(snippets, COMPACTION_CFG)
+        except Exception as e:
+            print(f"  ✗ {snippets!r} → {type(e).__name__}: {e}")
+            ok = False
+            continue
+        missing = [t for t in must_have if t not in compacted]
+        unwanted = [t for t in must_not if t in compacted]
+        if missing or unwanted:
+            print(f"  ✗ {compacted!r} (falta: {missing}, sobra: {unwanted})")
+            ok = False
+    print(f"Puntuación suelta y números repetidos: {'OK' if ok else 'FALLO'}")
+    return ok
+
+
+def auto_captions(minutes, seed=0):
+    """Fragmentos [texto, inicio, duración] al estilo de los subtítulos automáticos."""
+    rng = random.Random(seed)
+    snippets, previous, start = [], [], 0.0
+    while start < minutes * 60:
+        words = previous[-rng.randint(0, 4):] if previous else []
+        for _ in range(rng.randint(8, 12)):
+            roll = rng.random()
+            if roll < 0.06:
+                words.append(rng.choice(_FILLERS))
+            elif roll < 0.09:
+                words.append(rng.choice(TICKERS))
+            else:
+                word = rng.choice(_WORDS)
+                words.extend([word, word] if roll < 0.11 else [word])
+        if rng.random() < 0.03:
+            words.append("[Música]")
+        duration = round(rng.uniform(2.0, 4.0), 2)
+        snippets.append([" ".join(words), round(start, 2), duration])
+        previous = [w for w in words if not w.startswith("[")]
+        start += duration + (rng.uniform(0.8, 1.5) if rng.random() < 0.15 else 0.0)
+    return snippets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minutes", type=int, nargs="+", default=[10, 30, 90], help="Duración de los vídeos")
+    parser.add_argument("--repeat", type=int, default=10, help="Repeticiones por medida (se toma la mediana)")
+    args = parser.parse_args()
+
+    bot = load_bot_module()
+    checks_ok = all([check_tickers(bot), check_edge_cases(bot)])
+    print(f"\n{'minutos':>8}{'tokens brutos':>15}{'compactados':>13}{'ahorro':>8}{'tiempo (ms)':>13}")
+    for minutes in args.minutes:
+        snippets = auto_captions(minutes, seed=minutes)
+        raw = bot.count_tokens(" ".join(text for text, _, _ in snippets))
+        compacted = bot.count_tokens(bot.compact_transcript(snippets, COMPACTION_CFG))
+        elapsed = time_call(bot.compact_transcript, snippets, COMPACTION_CFG, repeat=args.repeat)
+        print(f"{minutes:>8}{raw:>15}{compacted:>13}{1 - compacted / raw:>8.0%}{elapsed:>13.1f}")
+    if not checks_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark: parser rápido del feed Atom de YouTube frente a feedparser.
+
+Parsea las muestras de benchmarks/samples (feeds con el esquema real de
+YouTube: 15 entradas con media:group, descripciones largas, entidades...)
+con las funciones reales del bot y mide, por feed:
+
+  - feedparser.parse + entry_to_video (el camino anterior)
+  - parse_youtube_feed leyendo el feed completo (canal nuevo o con pendientes)
+  - parse_youtube_feed con 1 vídeo nuevo (se para en el 2º, ya visto)
+  - parse_youtube_feed sin vídeos nuevos (se para en el 1º)
+
+Antes de medir comprueba que ambos parsers extraen exactamente los mismos
+vídeos. Al final estima la CPU diaria de parseo para N canales.
+
+Uso:
+    python benchmarks/bench_feed_parser.py
+    python benchmarks/bench_feed_parser.py --repeat 200 --channels 1000 --interval 900
+"""
+
+import argparse
+import glob
+import os
+
+import feedparser
+
+from bench_common import load_bot_module, time_call
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples")
+# Sin "description": feedparser la trata como HTML (escapa "&", quita "<...>") y el
+# parser rápido devuelve el texto tal cual; el pipeline no la usa
+FIELDS = ("id", "title", "link", "published", "channel")
+
+
+def feedparser_videos(bot, content):
+    feed = feedparser.parse(content)
+    return [v for v in (bot.entry_to_video(e, "canal") for e in feed.entries) if v]
+
+
+def check_same_videos(bot, name, content):
+    """Compara campo a campo lo que extraen los dos parsers. Returns: True si coinciden."""
+    expected = feedparser_videos(bot, content)
+    videos, complete = bot.parse_youtube_feed(content, "canal")
+    ok = complete and len(videos) == len(expected)
+    if not ok:
+        print(f"  ✗ {name}: {len(videos)} vídeos frente a {len(expected)} de feedparser")
+    for fast, slow in zip(videos, expected):
+        for field in FIELDS:
+            if fast.get(field) != slow.get(field):
+                print(f"  ✗ {name} {slow['id']}.{field}: {fast.get(field)!r} != {slow.get(field)!r}")
+                ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=100, help="Repeticiones por medida (se toma la mediana)")
+    parser.add_argument("--channels", type=int, default=1000, help="Canales para la estimación de CPU diaria")
+    parser.add_argument("--interval", type=int, default=900, help="Segundos entre comprobaciones de cada canal")
+    args = parser.parse_args()
+
+    bot = load_bot_module()
+    samples = {
+        os.path.basename(path): open(path, "rb").read()
+        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.xml")))
+    }
+
+    print(f"{'muestra':<30}{'KB':>6}{'feedparser':>12}{'completo':>10}{'1 nuevo':>10}{'0 nuevos':>10}  (ms)")
+    totals = {"feedparser": 0.0, "completo": 0.0, "1 nuevo": 0.0, "0 nuevos": 0.0}
+    for name, content in samples.items():
+        check_same_videos(bot, name, content)
+        ids = [v["id"] for v in bot.parse_youtube_feed(content, "canal")[0]]
+        timings = {
+            "feedparser": time_call(feedparser_videos, bot, content, repeat=args.repeat),
+            "completo": time_call(bot.parse_youtube_feed, content, "canal", repeat=args.repeat),
+            "1 nuevo": time_call(bot.parse_youtube_feed, content, "canal", set(ids[1:]), repeat=args.repeat),
+            "0 nuevos": time_call(bot.parse_youtube_feed, content, "canal", set(ids), repeat=args.repeat),
+        }
+        for key, value in timings.items():
+            totals[key] += value / len(samples)
+        print(f"{name:<30}{len(content) / 1024:>6.1f}" + "".join(f"{timings[k]:>10.3f}" if k != "feedparser"
+                                                             else f"{timings[k]:>12.3f}" for k in totals))
+
+    polls_per_day = args.channels * 86400 / args.interval
+    print(f"\nCPU de parseo al día con {args.channels} canales cada {args.interval}s "
+          f"({polls_per_day:.0f} feeds/día, sin contar los 304):")
+    for key, value in totals.items():
+        speedup = totals["feedparser"] / value if value else 0.0
+        print(f"  {key:<12}{value * polls_per_day / 1000:>9.1f} s/día   (x{speedup:.1f})")
+
+
+if __name__ == "__main__":
+    main()
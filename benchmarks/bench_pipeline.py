@@ -0,0 +1,279 @@
+"""Benchmark de extremo a extremo del pipeline (sin red).
+
+Ejecuta el código real del bot (get_new_videos → get_transcript_text →
+build_summary → deliver_summary, a través de process_channel y del pool de
+hilos) contra los servidores locales de standins.py, y mide:
+
+  - latencia por etapa (p50 / p90 / p99, en ms)
+  - vídeos por minuto
+  - errores y reintentos vistos por los servidores
+
+para 10, 100 y 1000 canales (o los que se indiquen).
+
+Uso:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --channels 10,100 --rounds 2 --openai-latency 0.5
+    python benchmarks/bench_pipeline.py --error-rate openai=0.05 --error-rate telegram=0.02
+    python benchmarks/bench_pipeline.py --channels 40 --openai-tpm 60000 --rate-window 6 [--no-openai-scheduler]
+    python benchmarks/bench_pipeline.py --channels 40 --transcript-words 300-12000 [--no-routing]
+
+Cada ronda publica un vídeo nuevo en todos los canales y procesa todos los
+canales vencidos, como haría run_forever() al vencer sus intervalos.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from bench_common import load_bot_module, percentile
+from standins import DEFAULT_LATENCY, StandInServer, StandInTranscriptApi
+
+STAGES = ["feed", "transcript", "openai", "telegram", "video"]
+
+
+class StageTimer:
+    """Envuelve funciones del bot para medir cuánto tarda cada etapa."""
+
+    def __init__(self):
+        self.samples = {stage: [] for stage in STAGES}
+        self._lock = threading.Lock()
+
+    def wrap(self, module, name, stage):
+        original = getattr(module, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self.samples[stage].append(elapsed)
+
+        setattr(module, name, timed)
+        return original
+
+    def reset(self):
+        with self._lock:
+            for values in self.samples.values():
+                values.clear()
+
+
+def configure_bot(bot, server, workdir, args):
+    """Apunta la configuración del bot a los servidores locales y a un directorio temporal."""
+    cfg = bot.CONFIG
+    cfg["feeds"] = []
+    cfg["openai"].update(api_key="sk-bench", stream=args.stream)
+    cfg["openai"]["routing"]["enabled"] = not args.no_routing
+    cfg["openai"]["rate_limits"].update(
+        enabled=not args.no_openai_scheduler,
+        requests_per_minute=args.openai_rpm or 10**9,
+        tokens_per_minute=args.openai_tpm or 10**12,
+    )
+    bot.OpenAIScheduler.WINDOW_SECONDS = args.rate_window
+    cfg["telegram"].update(
+        bot_token="123:bench",
+        chat_id="1000",
+        chat_ids=[],
+        api_base=server.base_url,
+        outbox_path=os.path.join(workdir, "outbox.sqlite"),
+    )
+    if not args.telegram_limits:
+        # Los límites reales (1 msg/s por chat) dominarían la medida con un solo chat
+        cfg["telegram"]["rate_limits"] = {"global_per_second": 10**6, "chat_per_second": 10**6, "group_per_minute": 10**6}
+    cfg["cookies_file"] = None
+    cfg["transcript_identities"] = [{"name": f"proxy-{i + 1}"} for i in range(args.identities - 1)]
+    cfg["transcript_rate"].update(
+        initial_interval_seconds=args.transcript_interval,
+        min_interval_seconds=min(args.transcript_interval, cfg["transcript_rate"]["min_interval_seconds"]),
+    )
+    bot.init_stage_limits(cfg["concurrency"])
+    bot.TRANSCRIPT_CACHE = bot.TranscriptCache(os.path.join(workdir, "transcripts.sqlite"))
+    bot.SUMMARY_CACHE = bot.SummaryCache(os.path.join(workdir, "summaries.sqlite"))
+
+    # Las transcripciones se piden al servidor local en lugar de a YouTube
+    StandInTranscriptApi.base_url = server.base_url
+    bot.YouTubeTranscriptApi = StandInTranscriptApi
+
+    # Clientes y outbox nuevos para cada escenario
+    bot._telegram_client = None
+    bot._transcript_client = None
+    bot._openai_scheduler = None
+    bot.METRICS = bot.Metrics()
+
+
+def run_scenario(bot, channels, args, timer):
+    """Procesa `args.rounds` rondas sobre `channels` canales y devuelve las métricas."""
+    server = StandInServer(
+        latency={"feed": args.feed_latency, "transcript": args.transcript_latency,
+                 "openai": args.openai_latency, "telegram": args.telegram_latency},
+        error_rates={service: float(rate) for service, rate in (item.split("=") for item in args.error_rate)},
+        transcript_words=tuple(int(n) for n in args.transcript_words.split("-"))
+        if "-" in args.transcript_words else int(args.transcript_words),
+        seed=args.seed,
+        openai_limits={"rpm": args.openai_rpm, "tpm": args.openai_tpm, "window": args.rate_window}
+        if args.openai_rpm or args.openai_tpm else None,
+    ).start()
+
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as workdir:
+        configure_bot(bot, server, workdir, args)
+        feeds = [
+            {"name": f"Canal {i}", "url": server.feed_url(f"UCbench{i:05d}"), "poll_interval_seconds": 900}
+            for i in range(channels)
+        ]
+        state = bot.StateStore(os.path.join(workdir, "state.sqlite"))
+        client = bot.OpenAI(api_key="sk-bench", base_url=f"{server.base_url}/v1", max_retries=args.openai_retries)
+        executor = ThreadPoolExecutor(max_workers=max(1, bot.CONFIG["concurrency"]["max_workers"]))
+
+        timer.reset()
+        delivered_before = len(timer.samples["video"])
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            server.next_round()
+            now = time.time()
+            futures = [executor.submit(bot.process_channel, bot.CONFIG, client, feed_cfg, state, now) for feed_cfg in feeds]
+            wait(futures)
+            for future in futures:
+                if future.exception() is not None:
+                    print(f"[bench] error: {future.exception()}", file=sys.stderr)
+        elapsed = time.perf_counter() - start
+
+        executor.shutdown()
+        state.close()
+        server.stop()
+
+    videos = len(timer.samples["video"]) - delivered_before
+    return {
+        "channels": channels,
+        "videos": videos,
+        "seconds": elapsed,
+        "videos_per_minute": videos / elapsed * 60 if elapsed else 0.0,
+        "stages": {
+            stage: (percentile(values, 50), percentile(values, 90), percentile(values, 99), len(values))
+            for stage, values in timer.samples.items()
+        },
+        "server": dict(server.counters),
+        "metrics": bot.METRICS.snapshot(),
+    }
+
+
+def print_report(result):
+    print(f"\n=== {result['channels']} canales: {result['videos']} vídeos en {result['seconds']:.1f}s "
+          f"→ {result['videos_per_minute']:.1f} vídeos/min ===")
+    print(f"{'etapa':<12}{'n':>7}{'p50 ms':>11}{'p90 ms':>11}{'p99 ms':>11}")
+    for stage in STAGES:
+        p50, p90, p99, count = result["stages"][stage]
+        print(f"{stage:<12}{count:>7}{p50:>11.1f}{p90:>11.1f}{p99:>11.1f}")
+    counters = result["server"]
+    errors = {k: v for k, v in counters.items() if k.endswith("_errors")}
+    print(f"peticiones: feed={counters.get('feed', 0)} (304: {counters.get('feed_304', 0)}), "
+          f"transcript={counters.get('transcript', 0)}, openai={counters.get('openai', 0)} "
+          f"(429: {counters.get('openai_429', 0)}), "
+          f"telegram={counters.get('telegram_sendMessage', 0)}")
+    if counters.get("openai_prompt_tokens"):
+        print(f"tokens de prompt: {counters['openai_prompt_tokens']} "
+              f"(en caché: {100.0 * counters.get('openai_cached_tokens', 0) / counters['openai_prompt_tokens']:.0f}%)")
+    if errors:
+        print("errores inyectados: " + ", ".join(f"{k[:-7]}={v}" for k, v in sorted(errors.items())))
+    print_routes(result["metrics"])
+
+
+def print_routes(snapshot):
+    """Resúmenes, latencia y coste por ruta del enrutado de modelos."""
+    routes = {}
+    for series, values in snapshot["histograms"].items():
+        if series.startswith("summary_seconds{"):
+            routes[series.split('"')[1]] = {"count": values["count"], "avg": values["avg"], "cost": 0.0}
+    for series, value in snapshot["counters"].items():
+        if series.startswith("openai_cost_usd_total{"):
+            route = series.split('route="')[1].split('"')[0]
+            routes.setdefault(route, {"count": 0, "avg": 0.0, "cost": 0.0})["cost"] += value
+    if not routes:
+        return
+    total_count = sum(r["count"] for r in routes.values())
+    total_cost = sum(r["cost"] for r in routes.values())
+    print(f"{'ruta':<14}{'resúmenes':>10}{'media s':>9}{'$/resumen':>11}")
+    for name, r in sorted(routes.items()):
+        print(f"{name:<14}{r['count']:>10}{r['avg']:>9.2f}{r['cost'] / max(1, r['count']):>11.4f}")
+    print(f"coste total: ${total_cost:.4f} (${total_cost / max(1, total_count):.4f}/resumen)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--channels", default="10,100,1000", help="Escenarios (nº de canales), separados por comas")
+    parser.add_argument("--rounds", type=int, default=1, help="Vídeos nuevos por canal (una ronda = uno)")
+    parser.add_argument("--workers", type=int, default=0, help="max_workers del pool (0 = el de CONFIG)")
+    parser.add_argument("--stage-limit", action="append", default=[], metavar="ETAPA=N",
+                        help="Sobrescribe un límite de concurrency.stages (p.ej. openai=8)")
+    parser.add_argument("--feed-latency", type=float, default=DEFAULT_LATENCY["feed"])
+    parser.add_argument("--transcript-latency", type=float, default=DEFAULT_LATENCY["transcript"])
+    parser.add_argument("--openai-latency", type=float, default=DEFAULT_LATENCY["openai"])
+    parser.add_argument("--telegram-latency", type=float, default=DEFAULT_LATENCY["telegram"])
+    parser.add_argument("--error-rate", action="append", default=[], metavar="SERVICIO=P",
+                        help="Probabilidad de error de un servicio (feed, transcript, openai, telegram)")
+    parser.add_argument("--transcript-interval", type=float, default=0.0,
+                        help="transcript_rate.initial_interval_seconds por identidad (por defecto 0; el real es 5)")
+    parser.add_argument("--identities", type=int, default=1,
+                        help="Identidades del pool de transcripciones (la directa + N-1 proxies simulados)")
+    parser.add_argument("--transcript-words", default="3000",
+                        help="Palabras por transcripción, o un rango MIN-MAX (distinto por vídeo)")
+    parser.add_argument("--openai-retries", type=int, default=0,
+                        help="max_retries del cliente de OpenAI (el bot usa 0: reintenta el planificador)")
+    parser.add_argument("--telegram-limits", action="store_true",
+                        help="Mantener los límites reales de la Bot API (1 msg/s por chat)")
+    parser.add_argument("--stream", action="store_true", help="Activar openai.stream (edición en vivo)")
+    parser.add_argument("--openai-rpm", type=int, default=0, help="Límite de peticiones de la cuenta simulada (0 = sin límite)")
+    parser.add_argument("--openai-tpm", type=int, default=0, help="Límite de tokens de la cuenta simulada (0 = sin límite)")
+    parser.add_argument("--rate-window", type=float, default=60.0,
+                        help="Duración de la ventana de los límites (acortarla comprime el tiempo del benchmark)")
+    parser.add_argument("--no-openai-scheduler", action="store_true",
+                        help="Desactivar el planificador RPM/TPM del bot (comparar con el comportamiento anterior)")
+    parser.add_argument("--no-routing", action="store_true",
+                        help="Desactivar el enrutado de modelos (todo con openai.model)")
+    parser.add_argument("--log-level", default="CRITICAL", help="Nivel de log del bot durante la medida")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    bot = load_bot_module()
+    bot.setup_logging({"log_level": args.log_level})
+    timer = StageTimer()
+    timer.wrap(bot, "get_new_videos", "feed")
+    timer.wrap(bot, "get_transcript_text", "transcript")
+    timer.wrap(bot, "build_summary", "openai")
+    timer.wrap(bot, "deliver_summary", "telegram")
+
+    # Solo cuentan como procesados los vídeos que llegaron a todos los destinos
+    process_video = bot.process_video
+
+    def timed_process_video(*call_args, **kwargs):
+        start = time.perf_counter()
+        ok = process_video(*call_args, **kwargs)
+        if ok:
+            with timer._lock:
+                timer.samples["video"].append((time.perf_counter() - start) * 1000)
+        return ok
+
+    bot.process_video = timed_process_video
+
+    concurrency_cfg = bot.CONFIG["concurrency"]
+    concurrency_cfg["max_workers"] = args.workers or concurrency_cfg["max_workers"]
+    for stage_limit in args.stage_limit:
+        stage, value = stage_limit.split("=")
+        concurrency_cfg["stages"][stage] = int(value)
+
+    print(f"Latencias simuladas (s): feed={args.feed_latency} transcript={args.transcript_latency} "
+          f"openai={args.openai_latency} telegram={args.telegram_latency}; "
+          f"workers={concurrency_cfg['max_workers']}, etapas={concurrency_cfg['stages']}")
+    for channels in (int(n) for n in args.channels.split(",")):
+        print_report(run_scenario(bot, channels, args, timer))
+
+
+if __name__ == "__main__":
+    main()
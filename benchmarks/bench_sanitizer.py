@@ -0,0 +1,94 @@
+"""Micro-benchmark de sanitize_html_for_telegram().
+
+Compara el sanitizador actual (una sola pasada, patrones precompilados) con
+la implementación anterior (pre/code + filtrado + balanceo en pasadas
+separadas, recompilando patrones en cada llamada) sobre resúmenes realistas
+de 4-20 KB, y comprueba que ambos producen exactamente la misma salida.
+
+Uso:
+    python benchmarks/bench_sanitizer.py
+"""
+
+import re
+
+from bench_common import load_bot_module, sample_model_output, time_call
+
+
+def legacy_sanitize_html_for_telegram(text):
+    """Implementación anterior, copiada tal cual como referencia."""
+    text = re.sub(r'</?pre[^>]*>', '', text)
+    text = re.sub(r'</?code[^>]*>', '', text)
+
+    allowed_tags = ['b', 'strong', 'i', 'em', 'u', 'ins', 's', 'strike',
+                    'del', 'a', 'tg-spoiler']
+
+    pattern = r'<(/?)(\w+)([^>]*)>'
+
+    def replace_tag(match):
+        closing = match.group(1)
+        tag = match.group(2).lower()
+        attrs = match.group(3)
+
+        if tag in allowed_tags:
+            if tag == 'a' and not closing:
+                href_match = re.search(r'href=["\']([^"\']*)["\']', attrs)
+                if href_match:
+                    return f'<a href="{href_match.group(1)}">'
+                else:
+                    return ''
+            return f'<{closing}{tag}>'
+        else:
+            return ''
+
+    cleaned = re.sub(pattern, replace_tag, text)
+
+    def balance_tags(text):
+        stack = []
+        result = []
+        tag_pattern = r'<(/?)(\w+)(?:\s+[^>]*)?>|([^<]+)'
+
+        for match in re.finditer(tag_pattern, text):
+            full_match = match.group(0)
+            is_closing = match.group(1) == '/'
+            tag_name = match.group(2)
+            text_content = match.group(3)
+
+            if text_content:
+                result.append(text_content)
+            elif tag_name:
+                tag_lower = tag_name.lower()
+                if is_closing:
+                    if stack and stack[-1] == tag_lower:
+                        stack.pop()
+                        result.append(full_match)
+                else:
+                    stack.append(tag_lower)
+                    result.append(full_match)
+
+        while stack:
+            tag = stack.pop()
+            result.append(f'</{tag}>')
+
+        return ''.join(result)
+
+    return balance_tags(cleaned)
+
+
+def main():
+    bot = load_bot_module()
+    print(f"{'tamaño':>8} {'anterior (ms)':>14} {'actual (ms)':>12} {'speedup':>8}  salida idéntica")
+    for size_kb in (4, 8, 12, 16, 20):
+        samples = [sample_model_output(size_kb * 1024, seed=seed) for seed in range(10)]
+        identical = all(
+            legacy_sanitize_html_for_telegram(sample) == bot.sanitize_html_for_telegram(sample)
+            for sample in samples
+        )
+        legacy_ms = sum(time_call(legacy_sanitize_html_for_telegram, s) for s in samples) / len(samples)
+        current_ms = sum(time_call(bot.sanitize_html_for_telegram, s) for s in samples) / len(samples)
+        print(f"{size_kb:>6}KB {legacy_ms:>14.3f} {current_ms:>12.3f} {legacy_ms / current_ms:>7.2f}x  {'sí' if identical else 'NO'}")
+        if not identical:
+            raise SystemExit("❌ La salida del sanitizador actual difiere de la implementación anterior")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Comprobaciones de extremo a extremo del pipeline (sin red).
+
+Ejecuta el código real del bot contra los servidores locales de standins.py
+en escenarios concretos y comprueba el resultado, no el tiempo:
+
+  - destino_bloqueado: un chat de destino responde 403 (bot expulsado). El
+    vídeo se entrega al resto, queda visto y no se reenvía en la siguiente
+    comprobación (que ya es un 304 porque se guardó el ETag).
+  - streaming_interrumpido: con openai.stream, un intento anterior murió a
+    medias y dejó mensajes en vivo apuntados en el estado. El nuevo intento
+    los borra, publica el resumen completo y no deja nada pendiente.
+  - reintento_transcripcion: la transcripción falla y el vídeo pasa a la cola
+    de reintentos. Al vencer, el reintento lanzado por pop_due llega a
+    process_video (como el hilo de run_forever) y vuelve a pedir la
+    transcripción: primero falla otra vez, luego funciona y se entrega.
+
+Uso:
+    python benchmarks/check_pipeline.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import bench_pipeline
+from bench_common import load_bot_module
+from standins import DEFAULT_LATENCY, StandInServer
+
+HEALTHY_CHAT = "1000"
+BLOCKED_CHAT = "-100666"
+
+
+class Scenario:
+    """Servidores locales, configuración y estado nuevos para un escenario."""
+
+    def __init__(self, bot, feed_fields=None, argv=(), **server_kwargs):
+        self.bot = bot
+        self.feed_fields = feed_fields or {}
+        self.argv = list(argv)
+        self.server = StandInServer(latency={service: 0 for service in DEFAULT_LATENCY}, **server_kwargs)
+        self.workdir = tempfile.TemporaryDirectory(prefix="check_pipeline_")
+
+    def __enter__(self):
+        self.server.start()
+        bench_pipeline.configure_bot(self.bot, self.server, self.workdir.name, bench_pipeline.parse_args(self.argv))
+        self.state = self.bot.StateStore(os.path.join(self.workdir.name, "state.sqlite"))
+        self.client = self.bot.OpenAI(api_key="sk-check", base_url=f"{self.server.base_url}/v1", max_retries=0)
+        self.feed = {"name": "Canal", "url": self.server.feed_url("UCcheck"), "poll_interval_seconds": 900,
+                     **self.feed_fields}
+        return self
+
+    def __exit__(self, *exc):
+        self.state.close()
+        self.server.stop()
+        self.workdir.cleanup()
+
+    def poll(self):
+        self.bot.process_channel(self.bot.CONFIG, self.client, self.feed, self.state, time.time())
+
+    def count(self, name):
+        return self.server.counters.get(name, 0)
+
+
+def check(name, conditions):
+    """Imprime el resultado de un escenario. Returns: True si se cumplen todas las condiciones."""
+    failed = [label for label, ok in conditions.items() if not ok]
+    print(f"{'✓' if not failed else '✗'} {name}" + (f": falla {', '.join(failed)}" if failed else ""))
+    return not failed
+
+
+def check_blocked_destination(bot):
+    with Scenario(bot, feed_fields={"chat_ids": [BLOCKED_CHAT]}, blocked_chats=[BLOCKED_CHAT]) as scenario:
+        scenario.server.next_round()
+        scenario.poll()
+        channel = scenario.state.get_channel("Canal")
+        video_id = channel.get("last_video_id")
+        sent = scenario.count("telegram_sendMessage")
+        scenario.poll()
+        return check("destino_bloqueado", {
+            "vídeo visto": video_id in channel.get("seen_ids", []),
+            "feed sincronizado": channel.get("feed_synced") is True,
+            "estado del vídeo cerrado": scenario.state.get_video(video_id) is None,
+            "entregado al chat sano": sent > scenario.count("telegram_forbidden"),
+            "un solo 403": scenario.count("telegram_forbidden") == 1,
+            "sin reenvíos": scenario.count("telegram_sendMessage") == sent,
+            "304 en la segunda comprobación": scenario.count("feed_304") == 1,
+        })
+
+
+def check_interrupted_stream(bot):
+    with Scenario(bot, argv=["--stream"]) as scenario:
+        scenario.server.next_round()
+        video_id = f"UCcheck-v{scenario.server.round}"
+        field = bot.stream_state_field(HEALTHY_CHAT)
+        scenario.state.update_video(video_id, "Canal", **{field: [901, 902]})
+        scenario.poll()
+        channel = scenario.state.get_channel("Canal")
+        return check("streaming_interrumpido", {
+            "vídeo visto": video_id in channel.get("seen_ids", []),
+            "estado del vídeo cerrado": scenario.state.get_video(video_id) is None,
+            "mensajes viejos borrados": scenario.count("telegram_deleteMessage") >= 2,
+            "resumen publicado en vivo": scenario.count("telegram_editMessageText") >= 1,
+        })
+
+
+def check_transcript_retry(bot):
+    def run_due_retries(scenario):
+        """Lo que hace el hilo de reintentos al vencer uno: pop_due → process_pushed_videos."""
+        for entry in bot.RETRIES.entries.values():
+            entry["next_attempt"] = time.time() - 1
+        for _, videos in bot.RETRIES.pop_due().items():
+            bot.process_pushed_videos(bot.CONFIG, scenario.client, scenario.feed, scenario.state, videos, "retry")
+
+    with Scenario(bot) as scenario:
+        scenario.server.next_round()
+        video_id = f"UCcheck-v{scenario.server.round}"
+        scenario.server.failing_transcripts.add(video_id)
+        bot.RETRIES = bot.TranscriptRetryQueue(bot.CONFIG["transcript_retry"], bot.CONFIG["telegram"], scenario.state)
+        try:
+            scenario.poll()
+            first = dict(bot.RETRIES.entries.get(video_id) or {"attempts": 0})
+            fetches = scenario.count("transcript")
+            run_due_retries(scenario)
+            second = dict(bot.RETRIES.entries.get(video_id) or {"attempts": 0})
+            retried_fetches = scenario.count("transcript")
+            scenario.server.failing_transcripts.clear()
+            sent = scenario.count("telegram_sendMessage")
+            run_due_retries(scenario)
+            resolved = video_id not in bot.RETRIES.entries
+        finally:
+            bot.RETRIES = None
+        return check("reintento_transcripcion", {
+            "en la cola tras el primer fallo": first["attempts"] == 1,
+            "el reintento pide la transcripción": retried_fetches > fetches,
+            "el reintento suma un intento": second["attempts"] == 2,
+            "resuelto al volver la transcripción": resolved,
+            "resumen entregado": scenario.count("telegram_sendMessage") > sent,
+            "estado del vídeo cerrado": scenario.state.get_video(video_id) is None,
+        })
+
+
+def main():
+    bot = load_bot_module()
+    bot.setup_logging({"log_level": "CRITICAL"})
+    results = [check_blocked_destination(bot), check_interrupted_stream(bot), check_transcript_retry(bot)]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
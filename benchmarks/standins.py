@@ -0,0 +1,588 @@
+"""Servidores HTTP locales que imitan a YouTube, OpenAI y Telegram.
+
+Permiten ejecutar el pipeline real del bot sin red: los feeds RSS, las
+transcripciones, chat.completions y la Bot API responden desde 127.0.0.1
+con la latencia y la tasa de errores que se configuren.
+
+Uso:
+    server = StandInServer(latency={"openai": 0.8}, error_rates={"telegram": 0.02})
+    server.start()
+    feed_url = server.feed_url("canal-1")
+    ...
+    server.stop()
+"""
+
+import collections
+import email.parser
+import hashlib
+import hmac
+import json
+import os
+import random
+import threading
+import time
+import types
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from youtube_transcript_api import RequestBlocked
+
+from bench_common import sample_model_output
+
+# Latencias medias (segundos) por servicio; cada respuesta varía ±50 %.
+# "batch" es lo que tarda un lote de la Batch API en completarse.
+DEFAULT_LATENCY = {"feed": 0.05, "transcript": 0.3, "openai": 1.5, "telegram": 0.1, "batch": 2.0}
+# Factor de latencia de OpenAI según el modelo pedido (subcadena del nombre)
+MODEL_SPEED = {"mini": 0.4}
+
+FEED_ENTRIES = 15  # Vídeos que devuelve el feed real de YouTube
+FEED_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_WORDS = ("mercado tipos de interés la Fed inflación beneficios empresariales volatilidad "
+          "el dólar los bonos a diez años liquidez rotación sectorial petróleo").split()
+
+
+def feed_xml(channel_id, round_number):
+    """Feed Atom con el formato de YouTube: un vídeo nuevo por canal en cada ronda."""
+    entries = []
+    for n in range(FEED_ENTRIES):
+        index = round_number - n
+        video_id = f"{channel_id}-v{index}"
+        published = (FEED_EPOCH + timedelta(hours=index)).isoformat()
+        entries.append(
+            f"<entry><id>yt:video:{video_id}</id><yt:videoId>{video_id}</yt:videoId>"
+            f"<yt:channelId>{channel_id}</yt:channelId><title>Vídeo {index} de {channel_id}</title>"
+            f'<link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>'
+            f"<published>{published}</published><updated>{published}</updated>"
+            f"<media:group><media:description>Descripción del vídeo {index}</media:description></media:group>"
+            f"</entry>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+        'xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>{channel_id}</title>" + "".join(entries) + "</feed>"
+    ).encode("utf-8")
+
+
+def notification_xml(channel_id, index, published=None):
+    """Aviso WebSub de YouTube: un feed Atom con una sola entrada (el vídeo nuevo)."""
+    video_id = f"{channel_id}-v{index}"
+    published = published or datetime.now(timezone.utc).isoformat()
+    topic = f"https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns="http://www.w3.org/2005/Atom">'
+        '<link rel="hub" href="https://pubsubhubbub.appspot.com"/>'
+        f'<link rel="self" href="{topic}"/>'
+        f"<title>YouTube video feed</title><updated>{published}</updated>"
+        f"<entry><id>yt:video:{video_id}</id><yt:videoId>{video_id}</yt:videoId>"
+        f"<yt:channelId>{channel_id}</yt:channelId><title>Vídeo {index} de {channel_id}</title>"
+        f'<link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>'
+        f"<author><name>{channel_id}</name><uri>https://www.youtube.com/channel/{channel_id}</uri></author>"
+        f"<published>{published}</published><updated>{published}</updated></entry></feed>"
+    ).encode("utf-8")
+
+
+def transcript_snippets(video_id, words):
+    """Transcripción sintética (determinista por vídeo) en tramos de ~12 palabras."""
+    rng = random.Random(video_id)
+    snippets = []
+    start = 0.0
+    for _ in range(max(1, words // 12)):
+        text = " ".join(rng.choice(_WORDS) for _ in range(12))
+        duration = round(rng.uniform(2.0, 5.0), 2)
+        snippets.append({"text": text, "start": round(start, 2), "duration": duration})
+        start += duration
+    return snippets
+
+
+class StandInServer:
+    """Un único servidor HTTP con las cuatro imitaciones, enrutadas por ruta.
+
+    - GET  /feeds/videos.xml?channel_id=X  → feed Atom (ETag por ronda, responde 304)
+    - GET  /transcript/<video_id>          → JSON con los tramos de la transcripción
+    - POST /v1/chat/completions            → respuesta de OpenAI (también en streaming SSE)
+    - POST /v1/files, /v1/batches          → Batch API (el lote se completa tras latency["batch"])
+    - GET  /v1/batches/<id>, /v1/files/<id>/content
+    - POST /bot<token>/<método>            → Bot API de Telegram
+
+    Args:
+        latency: Latencia media por servicio (feed, transcript, openai, telegram)
+        error_rates: Probabilidad de error por servicio (0-1). Los errores son los
+            habituales de cada servicio: 5xx en el feed, bloqueo de IP en
+            transcripciones, 429/500 en OpenAI y 429 con retry_after en Telegram
+        transcript_words: Palabras de cada transcripción, o (mínimo, máximo) para que
+            cada vídeo tenga una longitud distinta (determinista por vídeo)
+        summary_bytes: Tamaño aproximado de cada resumen generado
+        seed: Semilla del generador de latencias y errores
+        openai_limits: Límites de la cuenta simulada {"rpm", "tpm", "window"}: cada respuesta
+            de chat.completions lleva cabeceras x-ratelimit-* y lo que se pasa recibe 429.
+            "window" (por defecto 60 s) permite comprimir el tiempo en los benchmarks
+        blocked_chats: Chats en los que el bot fue expulsado: sus envíos reciben 403
+        failing_transcripts: Vídeos cuya transcripción responde 500 (se puede
+            modificar en marcha para que vuelvan a funcionar)
+    """
+
+    def __init__(self, latency=None, error_rates=None, transcript_words=3000, summary_bytes=3500, seed=0,
+                 openai_limits=None, blocked_chats=(), failing_transcripts=()):
+        self.latency = dict(DEFAULT_LATENCY, **(latency or {}))
+        self.openai_limits = dict(openai_limits or {})
+        self._openai_window = collections.deque()  # (momento, tokens) admitidos en la ventana
+        self.error_rates = dict(error_rates or {})
+        self.blocked_chats = {str(chat_id) for chat_id in blocked_chats}
+        self.failing_transcripts = set(failing_transcripts)
+        self.transcript_words = transcript_words
+        self.summary = sample_model_output(summary_bytes, seed=seed)
+        self.round = 0
+        self.counters = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._files = {}
+        self._batches = {}
+        self._recent_prompts = collections.deque(maxlen=32)
+        self._httpd = None
+        self.base_url = None
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.request_queue_size = 1024
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}"
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+    def next_round(self):
+        """Publica un vídeo nuevo en todos los canales."""
+        self.round += 1
+
+    def feed_url(self, channel_id):
+        return f"{self.base_url}/feeds/videos.xml?channel_id={urllib.parse.quote(channel_id)}"
+
+    # ------------------------------------------------------------------
+    # Peticiones
+    # ------------------------------------------------------------------
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def _delay_and_fail(self, service, factor=1.0):
+        """Simula la latencia del servicio; devuelve True si esta petición debe fallar."""
+        with self._lock:
+            delay = self.latency.get(service, 0) * factor * self._rng.uniform(0.5, 1.5)
+            fail = self._rng.random() < self.error_rates.get(service, 0)
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            self._count(f"{service}_errors")
+        return fail
+
+    def _reply(self, handler, status, body=b"", content_type="application/json", headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _handle(self, handler, method):
+        parsed = urllib.parse.urlparse(handler.path)
+        body = None
+        if method == "POST":
+            length = int(handler.headers.get("Content-Length") or 0)
+            raw = handler.rfile.read(length) if length else b""
+            if parsed.path.endswith("/v1/files"):
+                return self._upload_file(handler, raw)
+            body = json.loads(raw) if raw else {}
+
+        if parsed.path == "/feeds/videos.xml":
+            return self._feed(handler, urllib.parse.parse_qs(parsed.query))
+        if parsed.path.startswith("/transcript/"):
+            return self._transcript(handler, parsed.path.rsplit("/", 1)[1])
+        if parsed.path.endswith("/chat/completions"):
+            return self._openai(handler, body)
+        if "/v1/batches" in parsed.path:
+            return self._batch(handler, body, parsed.path.rsplit("/v1/batches", 1)[1].strip("/"))
+        if "/v1/files/" in parsed.path and parsed.path.endswith("/content"):
+            return self._file_content(handler, parsed.path.split("/")[-2])
+        if parsed.path.startswith("/bot"):
+            return self._telegram(handler, parsed.path.rsplit("/", 1)[1], body)
+        self._reply(handler, 404, {"error": "not found"})
+
+    def _feed(self, handler, query):
+        self._count("feed")
+        channel_id = query.get("channel_id", [""])[0]
+        if self._delay_and_fail("feed"):
+            return self._reply(handler, 503, b"Service Unavailable", "text/plain")
+        etag = f'"{channel_id}-{self.round}"'
+        if handler.headers.get("If-None-Match") == etag:
+            self._count("feed_304")
+            return self._reply(handler, 304, headers={"ETag": etag})
+        self._reply(handler, 200, feed_xml(channel_id, self.round), "application/atom+xml", {"ETag": etag})
+
+    def _transcript(self, handler, video_id):
+        self._count("transcript")
+        if self._delay_and_fail("transcript"):
+            return self._reply(handler, 429, {"error": "ip_blocked"})
+        if video_id in self.failing_transcripts:
+            self._count("transcript_failed")
+            return self._reply(handler, 500, {"error": "internal"})
+        words = self.transcript_words
+        if isinstance(words, (tuple, list)):
+            words = random.Random(video_id).randint(*words)
+        self._reply(handler, 200, {
+            "language_code": "es",
+            "is_generated": True,
+            "snippets": transcript_snippets(video_id, words),
+        })
+
+    def _cached_tokens(self, prompt):
+        """Imita la caché de prefijos de OpenAI: prefijo común con un prompt reciente,
+        en bloques de 128 tokens y solo a partir de 1024 (~4 caracteres por token)."""
+        with self._lock:
+            best = max((len(os.path.commonprefix([prompt, seen])) for seen in self._recent_prompts), default=0)
+            self._recent_prompts.append(prompt)
+        tokens = best // 4
+        return tokens // 128 * 128 if tokens >= 1024 else 0
+
+    def _completion(self, body):
+        """Cuerpo de una respuesta de chat.completions para la petición `body`."""
+        prompt = "".join(m.get("content") or "" for m in body.get("messages", []))
+        prompt_chars = len(prompt)
+        cached = self._cached_tokens(prompt)
+        with self._lock:
+            completion_id = f"chatcmpl-bench{self._rng.randint(0, 10**9)}"
+            self.counters["openai_prompt_tokens"] = self.counters.get("openai_prompt_tokens", 0) + prompt_chars // 4
+            self.counters["openai_cached_tokens"] = self.counters.get("openai_cached_tokens", 0) + cached
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "bench"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": self.summary}}],
+            "usage": {
+                "prompt_tokens": prompt_chars // 4,
+                "completion_tokens": len(self.summary) // 4,
+                "total_tokens": (prompt_chars + len(self.summary)) // 4,
+                "prompt_tokens_details": {"cached_tokens": cached},
+            },
+        }
+
+    def _rate_limit(self, body):
+        """Cuenta la petición en la ventana de la cuenta simulada.
+
+        Returns:
+            tuple: (cabe, cabeceras x-ratelimit-*, segundos hasta que se libere cupo)
+        """
+        limits = self.openai_limits
+        if not limits:
+            return True, {}, 0.0
+        rpm, tpm, window = limits.get("rpm") or 10**9, limits.get("tpm") or 10**12, limits.get("window") or 60
+        prompt_chars = sum(len(m.get("content") or "") for m in body.get("messages", []))
+        tokens = prompt_chars // 4 + (body.get("max_tokens") or len(self.summary) // 4)
+        now = time.time()
+        with self._lock:
+            while self._openai_window and self._openai_window[0][0] <= now - window:
+                self._openai_window.popleft()
+            used_requests = len(self._openai_window)
+            used_tokens = sum(t for _, t in self._openai_window)
+            fits = used_requests < rpm and used_tokens + tokens <= tpm
+            if fits:
+                self._openai_window.append((now, tokens))
+                used_requests += 1
+                used_tokens += tokens
+            oldest = self._openai_window[0][0] if self._openai_window else now
+        reset = max(0.0, oldest + window - now)
+        return fits, {
+            "x-ratelimit-limit-requests": str(rpm),
+            "x-ratelimit-limit-tokens": str(tpm),
+            "x-ratelimit-remaining-requests": str(max(0, rpm - used_requests)),
+            "x-ratelimit-remaining-tokens": str(max(0, tpm - used_tokens)),
+            "x-ratelimit-reset-requests": f"{reset:.3f}s",
+            "x-ratelimit-reset-tokens": f"{reset:.3f}s",
+        }, reset
+
+    def _openai(self, handler, body):
+        self._count("openai")
+        fits, rate_headers, reset = self._rate_limit(body)
+        if not fits:
+            self._count("openai_429")
+            rate_headers["retry-after-ms"] = str(int(reset * 1000))
+            return self._reply(handler, 429, {"error": {"message": "Rate limit reached for tokens", "type": "tokens",
+                                                        "code": "rate_limit_exceeded"}}, headers=rate_headers)
+        model = body.get("model", "")
+        speed = next((factor for name, factor in MODEL_SPEED.items() if name in model), 1.0)
+        if self._delay_and_fail("openai", speed):
+            if self.counters.get("openai_errors", 0) % 2:
+                return self._reply(handler, 429, {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                                   headers={"retry-after-ms": "50"})
+            return self._reply(handler, 500, {"error": {"message": "Internal error", "type": "server_error"}})
+
+        completion = self._completion(body)
+        if body.get("stream"):
+            return self._openai_stream(handler, body, completion["id"], rate_headers)
+        self._reply(handler, 200, completion, headers=rate_headers)
+
+    def _upload_file(self, handler, raw):
+        """POST /v1/files (multipart): guarda el JSONL de un lote."""
+        self._count("openai_files")
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {handler.headers['Content-Type']}\r\n\r\n".encode("utf-8") + raw
+        )
+        content = next(part.get_payload(decode=True) for part in message.get_payload() if part.get_filename())
+        with self._lock:
+            file_id = f"file-bench{len(self._files)}"
+            self._files[file_id] = content
+        self._reply(handler, 200, {"id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+                                   "filename": "batch.jsonl", "purpose": "batch", "status": "processed"})
+
+    def _file_content(self, handler, file_id):
+        with self._lock:
+            content = self._files.get(file_id)
+        if content is None:
+            return self._reply(handler, 404, {"error": {"message": "No such file"}})
+        self._reply(handler, 200, content, "application/octet-stream")
+
+    def _batch(self, handler, body, batch_id):
+        """POST /v1/batches crea un lote; GET /v1/batches/<id> lo consulta (y lo completa si ya toca)."""
+        if body is not None:
+            self._count("openai_batches")
+            with self._lock:
+                batch_id = f"batch_bench{len(self._batches)}"
+                self._batches[batch_id] = {
+                    "id": batch_id, "object": "batch", "endpoint": body["endpoint"], "errors": None,
+                    "input_file_id": body["input_file_id"], "completion_window": body["completion_window"],
+                    "status": "in_progress", "output_file_id": None, "error_file_id": None,
+                    "created_at": int(time.time()), "metadata": body.get("metadata"),
+                    "ready_at": time.time() + self.latency.get("batch", 0),
+                }
+            return self._reply(handler, 200, self._public_batch(batch_id))
+
+        with self._lock:
+            batch = self._batches.get(batch_id)
+        if batch is None:
+            return self._reply(handler, 404, {"error": {"message": "No such batch"}})
+        if batch["status"] == "in_progress" and time.time() >= batch["ready_at"]:
+            self._complete_batch(batch)
+        self._reply(handler, 200, self._public_batch(batch_id))
+
+    def _complete_batch(self, batch):
+        """Genera el fichero de resultados (y el de errores, según error_rates["openai"])."""
+        with self._lock:
+            lines = [json.loads(line) for line in self._files[batch["input_file_id"]].splitlines() if line.strip()]
+        output, errors = [], []
+        for line in lines:
+            self._count("openai_batch_requests")
+            with self._lock:
+                fail = self._rng.random() < self.error_rates.get("openai", 0)
+            if fail:
+                errors.append({"id": f"resp-{line['custom_id']}", "custom_id": line["custom_id"], "response": {
+                    "status_code": 500, "request_id": "bench",
+                    "body": {"error": {"message": "Internal error", "type": "server_error"}}}, "error": None})
+                continue
+            output.append({"id": f"resp-{line['custom_id']}", "custom_id": line["custom_id"], "response": {
+                "status_code": 200, "request_id": "bench", "body": self._completion(line["body"])}, "error": None})
+        with self._lock:
+            for kind, rows in (("output_file_id", output), ("error_file_id", errors)):
+                if rows:
+                    file_id = f"file-bench{len(self._files)}"
+                    self._files[file_id] = "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+                    batch[kind] = file_id
+            batch["status"] = "completed"
+            batch["request_counts"] = {"total": len(lines), "completed": len(output), "failed": len(errors)}
+
+    def _public_batch(self, batch_id):
+        with self._lock:
+            return {key: value for key, value in self._batches[batch_id].items() if key != "ready_at"}
+
+    def _openai_stream(self, handler, body, completion_id, headers=None):
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Connection", "close")
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        step = 200
+        for i in range(0, len(self.summary), step):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "bench"),
+                "choices": [{"index": 0, "delta": {"content": self.summary[i:i + step]}, "finish_reason": None}],
+            }
+            handler.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        handler.wfile.write(b"data: [DONE]\n\n")
+        handler.close_connection = True
+
+    def _telegram(self, handler, method, body):
+        self._count(f"telegram_{method}")
+        if self._delay_and_fail("telegram"):
+            return self._reply(handler, 429, {"ok": False, "error_code": 429,
+                                              "description": "Too Many Requests: retry after 1",
+                                              "parameters": {"retry_after": 1}})
+        if str(body.get("chat_id")) in self.blocked_chats:
+            self._count("telegram_forbidden")
+            return self._reply(handler, 403, {"ok": False, "error_code": 403,
+                                              "description": "Forbidden: bot was kicked from the group chat"})
+        if method == "sendMessage":
+            with self._lock:
+                message_id = self.counters.get("telegram_sendMessage", 0)
+            return self._reply(handler, 200, {"ok": True, "result": {
+                "message_id": message_id, "chat": {"id": body.get("chat_id")}, "text": body.get("text", "")}})
+        self._reply(handler, 200, {"ok": True, "result": True})
+
+
+class StandInHub:
+    """Hub WebSub local con el comportamiento del de YouTube.
+
+    - POST /subscribe (formulario hub.*) → 202 y verificación asíncrona: GET al
+      callback con hub.challenge; la suscripción solo queda activa si el
+      callback devuelve el challenge.
+    - publish(topic, cuerpo) reparte el aviso a los suscriptores del topic,
+      firmado con X-Hub-Signature (sha1) cuando se suscribieron con secreto.
+    """
+
+    def __init__(self, max_lease_seconds=864000):
+        self.max_lease_seconds = max_lease_seconds
+        self.subscriptions = {}         # (topic, callback) → {"secret", "expires"}
+        self.requests = []              # Peticiones de suscripción recibidas
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._httpd = None
+        self.url = None
+
+    def start(self):
+        hub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                form = {k: v[0] for k, v in urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+                with hub._lock:
+                    hub.requests.append(form)
+                if not form.get("hub.callback") or not form.get("hub.topic"):
+                    self.send_response(400)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(202)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                threading.Thread(target=hub._verify, args=(form,), daemon=True).start()
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/subscribe"
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+
+    def _verify(self, form):
+        lease = min(int(form.get("hub.lease_seconds") or self.max_lease_seconds), self.max_lease_seconds)
+        challenge = f"challenge-{random.randint(0, 10**9)}"
+        params = {
+            "hub.mode": form["hub.mode"],
+            "hub.topic": form["hub.topic"],
+            "hub.challenge": challenge,
+            "hub.lease_seconds": str(lease),
+        }
+        try:
+            response = self._session.get(form["hub.callback"], params=params, timeout=10)
+        except requests.exceptions.RequestException:
+            return
+        key = (form["hub.topic"], form["hub.callback"])
+        with self._lock:
+            if response.status_code // 100 != 2 or response.text != challenge:
+                return
+            if form["hub.mode"] == "unsubscribe":
+                self.subscriptions.pop(key, None)
+            else:
+                self.subscriptions[key] = {"secret": form.get("hub.secret", ""), "expires": time.time() + lease}
+
+    def publish(self, topic, body):
+        """Envía el aviso a todos los suscriptores del topic. Returns: lista de códigos HTTP."""
+        with self._lock:
+            targets = [(callback, sub["secret"]) for (t, callback), sub in self.subscriptions.items()
+                       if t == topic and sub["expires"] > time.time()]
+        statuses = []
+        for callback, secret in targets:
+            headers = {
+                "Content-Type": "application/atom+xml",
+                "Link": f'<{self.url}>; rel=hub, <{topic}>; rel=self',
+            }
+            if secret:
+                headers["X-Hub-Signature"] = "sha1=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha1).hexdigest()
+            statuses.append(self._session.post(callback, data=body, headers=headers, timeout=10).status_code)
+        return statuses
+
+
+class StandInTranscript:
+    """Misma forma que FetchedTranscript: iterable de tramos (text, start, duration)."""
+
+    def __init__(self, snippets, language_code, is_generated):
+        self.snippets = [types.SimpleNamespace(**s) for s in snippets]
+        self.language_code = language_code
+        self.is_generated = is_generated
+
+    def __iter__(self):
+        return iter(self.snippets)
+
+    def __len__(self):
+        return len(self.snippets)
+
+
+class StandInTranscriptApi:
+    """Sustituto de YouTubeTranscriptApi que lee la transcripción del servidor local.
+
+    Acepta los mismos argumentos (proxy_config, http_client); los proxies se
+    ignoran y la sesión se reutiliza como haría la librería real.
+    """
+
+    base_url = None
+
+    def __init__(self, proxy_config=None, http_client=None):
+        self._session = http_client or requests.Session()
+
+    def fetch(self, video_id, languages=("en",), **kwargs):
+        response = self._session.get(f"{self.base_url}/transcript/{urllib.parse.quote(video_id)}", timeout=30)
+        if response.status_code == 429:
+            raise RequestBlocked(video_id)
+        response.raise_for_status()
+        data = response.json()
+        return StandInTranscript(data["snippets"], data["language_code"], data["is_generated"])